@@ -1,102 +1,597 @@
 import streamlit as st
+from streamlit_autorefresh import st_autorefresh
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
-from datetime import datetime, timedelta
+import numpy as np
+import aiohttp
+import orjson
+import ijson
+import diskcache
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlencode
+import hashlib
 import time
 import json
 import os
+import threading
+
+# (connect, read) timeouts in seconds for GitLab API calls
+REQUEST_TIMEOUT = (5, 30)
+
+# In-flight API calls; kept near GitLab's default 10 requests/s limit
+MAX_CONCURRENT_REQUESTS = 10
+
+# GitLab's default API rate limit, in requests per second
+DEFAULT_RATE_LIMIT = 10
+
+# Upper bound on how long to honor a 429 Retry-After header, in seconds
+MAX_RETRY_AFTER = 60
+
+# Responses kept for ETag revalidation, per dashboard
+ETAG_CACHE_SIZE = 1000
+
+# Threads used to fetch the remaining pages of a paginated list
+MAX_PAGE_WORKERS = 8
+
+# Pipeline statuses shown on the pending tab
+PENDING_STATUSES = ['pending', 'created', 'running']
+
+# Colors shown next to pipeline and job statuses
+STATUS_COLORS = {
+    'success': '🟢',
+    'failed': '🔴',
+    'running': '🔵',
+    'pending': '🟡',
+    'canceled': '⚪',
+    'skipped': '⚫',
+    'created': '🟡',
+    'manual': '🟠'
+}
+DEFAULT_STATUS_COLOR = '⚪'
+
+# Pipeline fields kept when streaming REST pipeline lists in the fallback
+PIPELINE_FIELDS = ('id', 'status', 'ref', 'created_at', 'updated_at', 'web_url')
+
+# Statuses after which a pipeline's jobs no longer change, unless it is retried
+TERMINAL_STATUSES = ('success', 'failed', 'canceled', 'skipped')
+
+# Directory for responses that are kept across sessions and restarts
+DISK_CACHE_DIR = os.getenv('GITLAB_CACHE_DIR', '.gitlab_cache')
+
+# Seconds to cache API responses across reruns
+PROJECTS_CACHE_TTL = 600
+PIPELINES_CACHE_TTL = 30
+JOBS_CACHE_TTL = 20
+
+# Dashboards (token, connection pool, ETag store) kept alive per URL/token pair
+DASHBOARD_CACHE_SIZE = 16
+DASHBOARD_CACHE_TTL = 3600
+
+class RateLimiter:
+    """Thread-safe token bucket shared by all requests to one GitLab instance"""
+    
+    def __init__(self, rate=DEFAULT_RATE_LIMIT):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def _reserve(self):
+        """Take a token, returning how many seconds the caller must wait for it"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate)
+    
+    def acquire(self):
+        """Block until a request may be sent"""
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+    
+    async def acquire_async(self):
+        """Wait without blocking the event loop until a request may be sent"""
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+def get_retry_after(headers):
+    """Get the delay requested by a Retry-After header, in seconds"""
+    value = headers.get('Retry-After')
+    if not value:
+        return 1.0
+    
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            delay = 1.0
+    return min(max(delay, 0.0), MAX_RETRY_AFTER)
+
+class ETagCache:
+    """Thread-safe store of ETags and decoded bodies, keyed by request URL"""
+    
+    def __init__(self, max_size=ETAG_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key(url, params=None):
+        """Build the cache key for a GET request"""
+        return f"{url}?{urlencode(params)}" if params else url
+    
+    def get(self, key):
+        """Get the (etag, body, headers) stored for a key, or None"""
+        with self._lock:
+            return self._entries.get(key)
+    
+    def set(self, key, etag, body, headers=None):
+        """Store a response, evicting the oldest entry when full"""
+        with self._lock:
+            if len(self._entries) >= self.max_size and key not in self._entries:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (etag, body, headers)
+
+class GitLabSession(requests.Session):
+    """Session that waits on a RateLimiter before each request, retries a 429 once,
+    and revalidates JSON responses with their ETags"""
+    
+    def __init__(self, limiter, etags):
+        super().__init__()
+        self.limiter = limiter
+        self.etags = etags
+    
+    def request(self, method, url, **kwargs):
+        self.limiter.acquire()
+        response = super().request(method, url, **kwargs)
+        
+        if response.status_code == 429:
+            response.close()
+            time.sleep(get_retry_after(response.headers))
+            self.limiter.acquire()
+            response = super().request(method, url, **kwargs)
+        return response
+    
+    def get_json(self, url, params=None):
+        """GET a JSON endpoint and return its body and headers
+        
+        A body seen before is revalidated with If-None-Match, and a 304 reuses it.
+        """
+        key = ETagCache.key(url, params)
+        cached = self.etags.get(key)
+        headers = {'If-None-Match': cached[0]} if cached else {}
+        
+        response = self.get(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
+        if response.status_code == 304 and cached:
+            return cached[1], cached[2]
+        response.raise_for_status()
+        body = orjson.loads(response.content)
+        
+        etag = response.headers.get('ETag')
+        if etag:
+            self.etags.set(key, etag, body, response.headers)
+        return body, response.headers
+
+# The cached fetchers below take the session as an unhashed `_session` argument;
+# the access token is part of the cache key so users never share responses.
+# Errors are raised rather than returned so that failures are not cached.
+
+def fetch_all_pages(session, url, params):
+    """Get every page of a list endpoint, fetching pages 2..N in parallel"""
+    first_page, headers = session.get_json(url, {**params, 'page': 1})
+    # Copy so the session's ETag cache never sees the later pages appended
+    items = list(first_page)
+    
+    # GitLab omits X-Total-Pages for collections over 10,000 items; follow X-Next-Page instead
+    if not headers.get('X-Total-Pages'):
+        next_page = headers.get('X-Next-Page')
+        while next_page:
+            page_items, headers = session.get_json(url, {**params, 'page': next_page})
+            items.extend(page_items)
+            next_page = headers.get('X-Next-Page')
+        return items
+    
+    def fetch_page(page):
+        return session.get_json(url, {**params, 'page': page})[0]
+    
+    total_pages = int(headers['X-Total-Pages'])
+    if total_pages > 1:
+        with ThreadPoolExecutor(max_workers=MAX_PAGE_WORKERS) as executor:
+            for page_items in executor.map(fetch_page, range(2, total_pages + 1)):
+                items.extend(page_items)
+    return items
+
+@st.cache_data(ttl=PROJECTS_CACHE_TTL, show_spinner=False)
+def fetch_group_projects(_session, base_api_url, access_token, group_id):
+    """Get all projects in a group"""
+    url = f"{base_api_url}/groups/{group_id}/projects"
+    params = {'per_page': 100, 'simple': True}
+    
+    return fetch_all_pages(_session, url, params)
+
+@st.cache_resource(show_spinner=False)
+def get_disk_cache():
+    """Get the on-disk response cache, or None if its directory is not writable"""
+    try:
+        return diskcache.Cache(DISK_CACHE_DIR)
+    except OSError:
+        return None
+
+@st.cache_data(ttl=JOBS_CACHE_TTL, show_spinner=False)
+def fetch_pipeline_jobs(_session, base_api_url, access_token, project_id, pipeline_id, pipeline_status, pipeline_updated):
+    """Get jobs for a specific pipeline, served from disk once the pipeline has finished"""
+    url = f"{base_api_url}/projects/{project_id}/pipelines/{pipeline_id}/jobs"
+    # Only a finished pipeline's jobs are final; bridge jobs are not in this list, so the
+    # job statuses alone can't tell whether the pipeline is still running
+    disk_cache = get_disk_cache() if pipeline_status in TERMINAL_STATUSES else None
+    # Hash the token so it is never written to disk but users still never share entries.
+    # The update time changes when a finished pipeline is retried, which retires the entry.
+    key = (
+        'all_jobs', base_api_url, hashlib.sha256(access_token.encode()).hexdigest(),
+        int(project_id), int(pipeline_id), pipeline_updated
+    )
+    
+    if disk_cache is not None:
+        jobs = disk_cache.get(key)
+        if jobs is not None:
+            return jobs
+    
+    jobs = fetch_all_pages(_session, url, {'per_page': 100})
+    if disk_cache is not None:
+        disk_cache.set(key, jobs)
+    return jobs
+
+# Projects per GraphQL request; GitLab caps connection pages at 100 nodes
+GRAPHQL_BATCH_SIZE = 100
+
+# Seconds to use the REST fallback before trying GraphQL again after a failure
+GRAPHQL_RETRY_INTERVAL = 600
+
+# Only the pipeline fields the dashboard displays
+PROJECTS_PIPELINES_QUERY = """
+query($ids: [ID!], $first: Int) {
+  projects(ids: $ids, first: 100) {
+    nodes {
+      id
+      pipelines(first: $first) {
+        nodes { id status ref createdAt updatedAt path user { name } }
+      }
+    }
+  }
+}
+"""
+
+def post_graphql(session, graphql_url, query, variables):
+    """POST a GraphQL query and return its data, raising on GraphQL errors"""
+    response = session.post(graphql_url, json={'query': query, 'variables': variables}, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    body = orjson.loads(response.content)
+    if body.get('errors'):
+        raise requests.RequestException(body['errors'][0].get('message', 'GraphQL error'))
+    return body['data']
+
+def gid_to_id(gid):
+    """Convert a GraphQL global ID such as gid://gitlab/Project/42 to 42"""
+    return int(gid.rsplit('/', 1)[-1])
+
+@st.cache_data(ttl=PIPELINES_CACHE_TTL, show_spinner=False)
+def fetch_projects_pipelines(_session, gitlab_url, access_token, project_ids, per_page):
+    """Get recent pipelines for many projects, as REST-shaped dicts keyed by project ID"""
+    graphql_url = f"{gitlab_url}/api/graphql"
+    pipelines_by_project = {project_id: [] for project_id in project_ids}
+    
+    for start in range(0, len(project_ids), GRAPHQL_BATCH_SIZE):
+        batch = project_ids[start:start + GRAPHQL_BATCH_SIZE]
+        variables = {'ids': [f"gid://gitlab/Project/{project_id}" for project_id in batch], 'first': per_page}
+        data = post_graphql(_session, graphql_url, PROJECTS_PIPELINES_QUERY, variables)
+        
+        for project in data['projects']['nodes']:
+            pipelines_by_project[gid_to_id(project['id'])] = [
+                {
+                    'id': gid_to_id(pipeline['id']),
+                    'status': pipeline['status'].lower(),
+                    'ref': pipeline['ref'],
+                    'created_at': pipeline['createdAt'],
+                    'updated_at': pipeline['updatedAt'],
+                    'web_url': f"{gitlab_url}{pipeline['path']}" if pipeline['path'] else '',
+                    'user': pipeline['user']
+                }
+                for pipeline in project['pipelines']['nodes']
+            ]
+    return pipelines_by_project
 
 class GitLabDashboard:
     def __init__(self, gitlab_url, access_token):
         self.gitlab_url = gitlab_url.rstrip('/')
         self.access_token = access_token
-        self.headers = {'PRIVATE-TOKEN': access_token}
+        self.headers = {'PRIVATE-TOKEN': access_token, 'Accept-Encoding': 'gzip, deflate'}
         self.base_api_url = f"{self.gitlab_url}/api/v4"
+        self.limiter = RateLimiter()
+        self.etags = ETagCache()
+        self.session = self._create_session()
+        self.graphql_error = None
+        self.graphql_failed_at = None
+    
+    def _create_session(self):
+        """Create a pooled, rate-limited HTTP session that is reused across API calls"""
+        session = GitLabSession(self.limiter, self.etags)
+        session.headers.update(self.headers)
+        # These retries happen inside the adapter, below the rate limiter, so they are not throttled
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=32, max_retries=retry)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
+    def set_rate_limit(self, rate):
+        """Set the maximum API requests per second for every session using this dashboard"""
+        self.limiter.rate = rate
     
     def get_group_projects(self, group_id):
-        """Get all projects in a group"""[22]
-        url = f"{self.base_api_url}/groups/{group_id}/projects"
-        params = {'per_page': 100, 'simple': True}
-        
+        """Get all projects in a group"""
         try:
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return fetch_group_projects(self.session, self.base_api_url, self.access_token, group_id)
+        except (requests.RequestException, ValueError) as e:
             st.error(f"Error fetching group projects: {str(e)}")
             return []
     
-    def get_project_pipelines(self, project_id, per_page=20):
-        """Get pipelines for a specific project"""[22]
-        url = f"{self.base_api_url}/projects/{project_id}/pipelines"
-        params = {'per_page': per_page, 'sort': 'desc'}
-        
+    def get_pipeline_jobs(self, project_id, pipeline_id, pipeline_status=None, pipeline_updated=None):
+        """Get jobs for a specific pipeline"""
         try:
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            st.error(f"Error fetching pipelines for project {project_id}: {str(e)}")
+            return fetch_pipeline_jobs(
+                self.session, self.base_api_url, self.access_token,
+                project_id, pipeline_id, pipeline_status, pipeline_updated
+            )
+        except (requests.RequestException, ValueError) as e:
             return []
     
-    def get_pipeline_jobs(self, project_id, pipeline_id):
-        """Get jobs for a specific pipeline"""[36]
-        url = f"{self.base_api_url}/projects/{project_id}/pipelines/{pipeline_id}/jobs"
+    def get_projects_pipelines(self, project_ids, per_page=20):
+        """Get pipelines for many projects via GraphQL, or None if GraphQL is unavailable
+        
+        A failure is kept in `graphql_error` and GraphQL is skipped until
+        GRAPHQL_RETRY_INTERVAL has passed, so reruns don't repeat a failing request.
+        """
+        if self.graphql_failed_at and time.monotonic() - self.graphql_failed_at < GRAPHQL_RETRY_INTERVAL:
+            return None
         
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            return []
+            pipelines_by_project = fetch_projects_pipelines(
+                self.session, self.gitlab_url, self.access_token, tuple(project_ids), per_page
+            )
+        except (requests.RequestException, ValueError) as e:
+            self.graphql_error = str(e)
+            self.graphql_failed_at = time.monotonic()
+            return None
+        
+        self.graphql_error = None
+        self.graphql_failed_at = None
+        return pipelines_by_project
+
+async def parse_pipelines(stream):
+    """Stream a JSON array of pipelines, keeping only the fields the dashboard displays"""
+    return [
+        {
+            **{field: pipeline.get(field) for field in PIPELINE_FIELDS},
+            'user': {'name': pipeline['user'].get('name')} if pipeline.get('user') else None
+        }
+        async for pipeline in ijson.items_async(stream, 'item')
+    ]
+
+class AsyncGitLabDashboard:
+    """Async twin of GitLabDashboard for fanning out pipeline requests"""
     
-    def format_datetime(self, dt_string):
-        """Format datetime string for display"""
-        if not dt_string:
-            return "N/A"
+    def __init__(self, gitlab_url, access_token, limiter=None, etags=None, max_connections=20):
+        self.gitlab_url = gitlab_url.rstrip('/')
+        self.headers = {'PRIVATE-TOKEN': access_token, 'Accept-Encoding': 'gzip, deflate'}
+        self.base_api_url = f"{self.gitlab_url}/api/v4"
+        self.limiter = limiter or RateLimiter()
+        self.etags = etags if etags is not None else ETagCache()
+        self.max_connections = max_connections
+        self.session = None
+    
+    async def __aenter__(self):
+        self.session = aiohttp.ClientSession(
+            headers=self.headers,
+            connector=aiohttp.TCPConnector(limit=self.max_connections),
+            timeout=aiohttp.ClientTimeout(sock_connect=REQUEST_TIMEOUT[0], sock_read=REQUEST_TIMEOUT[1])
+        )
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.session.close()
+    
+    async def _get_json(self, url, params=None, parse=None, retry_rate_limited=True):
+        """GET a URL and decode the JSON body, retrying a 429 once
         
-        try:
-            dt = datetime.fromisoformat(dt_string.replace('Z', '+00:00'))
-            return dt.strftime("%Y-%m-%d %H:%M:%S")
-        except:
-            return dt_string
-    
-    def get_time_ago(self, dt_string):
-        """Get human-readable time difference"""
-        if not dt_string:
-            return "N/A"
+        A body seen before is revalidated with If-None-Match, and a 304 reuses it.
+        `parse` decodes the streamed body instead of loading it with orjson.
+        """
+        key = ETagCache.key(url, params)
+        cached = self.etags.get(key)
+        headers = {'If-None-Match': cached[0]} if cached else {}
+        
+        await self.limiter.acquire_async()
+        async with self.session.get(url, params=params, headers=headers) as response:
+            if response.status == 429 and retry_rate_limited:
+                delay = get_retry_after(response.headers)
+            elif response.status == 304 and cached:
+                return cached[1]
+            else:
+                response.raise_for_status()
+                if parse:
+                    body = await parse(response.content)
+                else:
+                    body = await response.json(loads=orjson.loads)
+                
+                etag = response.headers.get('ETag')
+                if etag:
+                    self.etags.set(key, etag, body)
+                return body
+        
+        await asyncio.sleep(delay)
+        return await self._get_json(url, params, parse, retry_rate_limited=False)
+    
+    async def get_project_pipelines(self, project_id, per_page=20):
+        """Get pipelines for a specific project"""
+        url = f"{self.base_api_url}/projects/{project_id}/pipelines"
+        params = {'per_page': per_page, 'sort': 'desc'}
         
         try:
-            dt = datetime.fromisoformat(dt_string.replace('Z', '+00:00'))
-            now = datetime.now(dt.tzinfo)
-            delta = now - dt
+            # Stream the array so full pipeline objects are never held all at once
+            return await self._get_json(url, params, parse=parse_pipelines)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ijson.JSONError) as e:
+            st.error(f"Error fetching pipelines for project {project_id}: {str(e)}")
+            return []
+    
+    async def fetch_all(self, projects, per_page=20, on_progress=None):
+        """Get pipelines for every project"""
+        sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        done = 0
+        
+        async def one(project):
+            nonlocal done
+            async with sem:
+                pipelines = await self.get_project_pipelines(project['id'], per_page)
             
-            if delta.days > 0:
-                return f"{delta.days} days ago"
-            elif delta.seconds > 3600:
-                hours = delta.seconds // 3600
-                return f"{hours} hours ago"
-            elif delta.seconds > 60:
-                minutes = delta.seconds // 60
-                return f"{minutes} minutes ago"
+            done += 1
+            if on_progress:
+                on_progress(done, project)
+            return pipelines
+        
+        results = await asyncio.gather(*[one(project) for project in projects])
+        return {project['id']: pipelines for project, pipelines in zip(projects, results)}
+
+# Not wrapped in st.cache_data: the fan-out reports progress and errors to the page,
+# and a failed project would otherwise be cached as having no pipelines.
+def fetch_all_pipelines(gitlab_url, access_token, projects, per_page=20, limiter=None, etags=None, on_progress=None):
+    """Run the async pipeline fan-out from synchronous Streamlit code"""
+    async def run():
+        async with AsyncGitLabDashboard(gitlab_url, access_token, limiter, etags) as client:
+            return await client.fetch_all(projects, per_page, on_progress)
+    
+    return asyncio.run(run())
+
+@st.cache_resource(show_spinner=False, max_entries=DASHBOARD_CACHE_SIZE, ttl=DASHBOARD_CACHE_TTL)
+def get_dashboard(gitlab_url, access_token):
+    """Get a dashboard instance whose HTTP session survives reruns"""
+    return GitLabDashboard(gitlab_url, access_token)
+
+def update_rate_limit(dashboard):
+    """Apply the rate limit entered in the sidebar to a shared dashboard"""
+    dashboard.set_rate_limit(st.session_state['rate_limit'])
+
+def to_utc_datetimes(series):
+    """Parse a series of ISO 8601 strings, with unparseable values as NaT"""
+    # An explicit format stops pandas inferring one from the first row, which would
+    # turn timestamps with different fractional-second precision into NaT
+    return pd.to_datetime(series, utc=True, errors='coerce', format='ISO8601')
+
+def format_datetimes(series):
+    """Format a series of datetime strings for display"""
+    formatted = to_utc_datetimes(series).dt.strftime("%Y-%m-%d %H:%M:%S")
+    # Show unparseable values as-is, and missing ones as N/A
+    return formatted.fillna(series).replace('', "N/A").fillna("N/A")
+
+def get_times_ago(series):
+    """Get human-readable time differences for a series of datetime strings"""
+    seconds = (pd.Timestamp.now(tz='UTC') - to_utc_datetimes(series)).dt.total_seconds()
+    whole = seconds.fillna(0).astype('int64')
+    
+    return pd.Series(np.select(
+        [seconds.isna(), whole >= 86400, whole > 3600, whole > 60],
+        [
+            "N/A",
+            (whole // 86400).astype(str) + " days ago",
+            (whole // 3600).astype(str) + " hours ago",
+            (whole // 60).astype(str) + " minutes ago"
+        ],
+        default="Just now"
+    ), index=series.index)
+
+def get_status_colors(statuses):
+    """Map a series of pipeline or job statuses to their colors"""
+    # Map as plain objects: on a Categorical a one-to-one map stays categorical,
+    # and fillna would then reject the default color as a new category
+    return statuses.astype(object).map(STATUS_COLORS).fillna(DEFAULT_STATUS_COLOR)
+
+def update_pipeline_selection(editor_key, selection_key, version_key, pipeline_ids):
+    """Apply ticks in a "Show jobs" editor to the selected pipeline IDs"""
+    selection = st.session_state[selection_key]
+    for position, changes in st.session_state[editor_key]['edited_rows'].items():
+        if 'Show jobs' in changes:
+            pipeline_id = pipeline_ids[int(position)]
+            if changes['Show jobs']:
+                selection.add(pipeline_id)
             else:
-                return "Just now"
-        except:
-            return "N/A"
-
-def get_status_color(status):
-    """Return color based on pipeline status"""[6][10]
-    colors = {
-        'success': '🟢',
-        'failed': '🔴',
-        'running': '🔵',
-        'pending': '🟡',
-        'canceled': '⚪',
-        'skipped': '⚫',
-        'created': '🟡',
-        'manual': '🟠'
-    }
-    return colors.get(status, '⚪')
+                selection.discard(pipeline_id)
+    
+    # Start a fresh editor so no row-position edits carry over to refreshed data
+    st.session_state[version_key] += 1
+
+def select_pipelines(view, pipeline_ids, key):
+    """Show pipelines with a "Show jobs" column and return the ticked pipeline IDs"""
+    # The editor keeps edits by row position, which point at other pipelines once the
+    # data refreshes; keep the selection by pipeline ID instead
+    selection_key = f"{key}_selected"
+    version_key = f"{key}_version"
+    if selection_key not in st.session_state:
+        st.session_state[selection_key] = set()
+        st.session_state[version_key] = 0
+    
+    selection = st.session_state[selection_key]
+    selection.intersection_update(pipeline_ids)
+    editor_key = f"{key}_{st.session_state[version_key]}"
+    
+    view.insert(0, 'Show jobs', [pipeline_id in selection for pipeline_id in pipeline_ids])
+    st.data_editor(
+        view,
+        column_config={
+            'Show jobs': st.column_config.CheckboxColumn('Show jobs'),
+            'Web URL': st.column_config.LinkColumn('View')
+        },
+        disabled=[column for column in view.columns if column != 'Show jobs'],
+        use_container_width=True,
+        hide_index=True,
+        key=editor_key,
+        on_change=update_pipeline_selection,
+        args=(editor_key, selection_key, version_key, pipeline_ids)
+    )
+    return selection
+
+def show_selected_jobs(dashboard, pipelines_df, selected):
+    """Show a jobs table for each pipeline ticked in a "Show jobs" column"""
+    # Only fetch jobs for the pipelines the user ticks; reloads hit the jobs cache
+    columns = ['Project', 'Branch', 'Project ID', 'Pipeline ID', 'Status', 'Updated']
+    selected_rows = pipelines_df[selected][columns].itertuples(index=False, name=None)
+    
+    for project, branch, project_id, pipeline_id, status, updated in selected_rows:
+        st.subheader(f"Jobs: {project} - {branch}")
+        
+        jobs = dashboard.get_pipeline_jobs(project_id, pipeline_id, status, updated)
+        if jobs:
+            job_statuses = pd.Series([job['status'] for job in jobs])
+            st.dataframe(
+                pd.DataFrame({
+                    'Status Icon': get_status_colors(job_statuses),
+                    'Job': [job['name'] for job in jobs],
+                    'Stage': [job.get('stage', '') for job in jobs],
+                    'Status': job_statuses
+                }),
+                use_container_width=True,
+                hide_index=True
+            )
+        else:
+            st.info("No jobs found for this pipeline.")
 
 def get_env_config():
     """Get configuration from environment variables"""
@@ -143,8 +638,8 @@ def main():
     auto_refresh = st.sidebar.checkbox("Auto-refresh (30s)", value=False)
     
     if auto_refresh:
-        time.sleep(30)
-        st.rerun()
+        # Schedules a browser-side rerun instead of blocking the script thread
+        st_autorefresh(interval=30_000, key='auto_refresh')
     
     # Manual refresh button
     if st.sidebar.button("🔄 Refresh Now"):
@@ -155,7 +650,24 @@ def main():
         return
     
     # Initialize dashboard
-    dashboard = GitLabDashboard(gitlab_url, access_token)
+    dashboard = get_dashboard(gitlab_url, access_token)
+    
+    # The limiter belongs to the shared dashboard, so show its current rate and only
+    # change it when this session edits the value
+    st.session_state['rate_limit'] = dashboard.limiter.rate
+    st.sidebar.number_input(
+        "API rate limit (requests/s)",
+        min_value=1,
+        max_value=1000,
+        key='rate_limit',
+        on_change=update_rate_limit,
+        args=(dashboard,),
+        help="Shared by every session using this GitLab URL and token. Raise this if your "
+             "GitLab instance allows more than the default 10 requests per second"
+    )
+    
+    if get_disk_cache() is None:
+        st.sidebar.caption(f"⚠️ Cache directory {DISK_CACHE_DIR} is not writable; finished jobs won't be kept on disk.")
     
     # Get projects in the group
     with st.spinner("Fetching group projects..."):
@@ -173,53 +685,75 @@ def main():
     with tab1:
         st.header("Pipeline Status Overview")
         
-        # Collect all pipeline data
-        all_pipelines_data = []
-        progress_bar = st.progress(0)
-        status_text = st.empty()
+        # Collect all pipeline data column by column
+        projects_col, project_ids, pipeline_ids, statuses, branches = [], [], [], [], []
+        created, updated, web_urls, users = [], [], [], []
+        
+        with st.spinner("Fetching pipelines..."):
+            pipelines_by_project = dashboard.get_projects_pipelines([project['id'] for project in projects], per_page=5)
         
-        for i, project in enumerate(projects):
-            status_text.text(f"Fetching pipelines for {project['name']}...")
-            pipelines = dashboard.get_project_pipelines(project['id'], per_page=5)
+        if pipelines_by_project is None:
+            # GraphQL unavailable (e.g. older self-managed GitLab); fall back to one REST call per project
+            st.warning(f"GraphQL API unavailable, loading pipelines over REST instead: {dashboard.graphql_error}")
+            progress_bar = st.progress(0)
+            status_text = st.empty()
             
-            for pipeline in pipelines:
-                all_pipelines_data.append({
-                    'Project': project['name'],
-                    'Project ID': project['id'],
-                    'Pipeline ID': pipeline['id'],
-                    'Status': pipeline['status'],
-                    'Branch': pipeline['ref'],
-                    'Created': pipeline.get('created_at', ''),
-                    'Updated': pipeline.get('updated_at', ''),
-                    'Web URL': pipeline.get('web_url', ''),
-                    'User': pipeline.get('user', {}).get('name', 'N/A') if pipeline.get('user') else 'N/A'
-                })
+            def update_progress(done, project):
+                status_text.text(f"Fetched pipelines for {project['name']}")
+                progress_bar.progress(done / len(projects))
             
-            progress_bar.progress((i + 1) / len(projects))
+            pipelines_by_project = fetch_all_pipelines(
+                gitlab_url, access_token, projects, per_page=5,
+                limiter=dashboard.limiter, etags=dashboard.etags, on_progress=update_progress
+            )
+            status_text.empty()
+            progress_bar.empty()
+        
+        for project in projects:
+            for pipeline in pipelines_by_project.get(project['id'], []):
+                projects_col.append(project['name'])
+                project_ids.append(project['id'])
+                pipeline_ids.append(pipeline['id'])
+                statuses.append(pipeline['status'])
+                branches.append(pipeline['ref'])
+                created.append(pipeline.get('created_at', ''))
+                updated.append(pipeline.get('updated_at', ''))
+                web_urls.append(pipeline.get('web_url', ''))
+                users.append(pipeline.get('user', {}).get('name', 'N/A') if pipeline.get('user') else 'N/A')
+        
+        df = pd.DataFrame({
+            'Project': projects_col,
+            'Project ID': project_ids,
+            'Pipeline ID': pipeline_ids,
+            'Status': pd.Categorical(statuses),
+            'Branch': pd.Categorical(branches),
+            'Created': created,
+            'Updated': updated,
+            'Web URL': web_urls,
+            'User': users
+        })
         
-        status_text.empty()
-        progress_bar.empty()
+        # Filtered views shared with the pending and success tabs
+        st.session_state['pending_df'] = df[df['Status'].isin(PENDING_STATUSES)]
+        st.session_state['success_df'] = df[df['Status'] == 'success'].sort_values('Updated', ascending=False).head(10)
         
-        if all_pipelines_data:
-            df = pd.DataFrame(all_pipelines_data)
+        if not df.empty:
             
             # Status summary
+            counts = df['Status'].value_counts()
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
-                success_count = len(df[df['Status'] == 'success'])
-                st.metric("✅ Successful", success_count)
+                st.metric("✅ Successful", int(counts.get('success', 0)))
             
             with col2:
-                failed_count = len(df[df['Status'] == 'failed'])
-                st.metric("❌ Failed", failed_count)
+                st.metric("❌ Failed", int(counts.get('failed', 0)))
             
             with col3:
-                running_count = len(df[df['Status'] == 'running'])
-                st.metric("🔵 Running", running_count)
+                st.metric("🔵 Running", int(counts.get('running', 0)))
             
             with col4:
-                pending_count = len(df[df['Status'].isin(['pending', 'created'])])
+                pending_count = int(counts.get('pending', 0) + counts.get('created', 0))
                 st.metric("⏳ Pending", pending_count)
             
             # Display recent pipelines
@@ -227,9 +761,9 @@ def main():
             
             # Format the display dataframe
             display_df = df.copy()
-            display_df['Status Icon'] = display_df['Status'].apply(get_status_color)
-            display_df['Created'] = display_df['Created'].apply(dashboard.format_datetime)
-            display_df['Time Ago'] = df['Updated'].apply(dashboard.get_time_ago)
+            display_df['Status Icon'] = get_status_colors(display_df['Status'])
+            display_df['Created'] = format_datetimes(df['Created'])
+            display_df['Time Ago'] = get_times_ago(df['Updated'])
             
             # Select columns for display
             display_columns = ['Status Icon', 'Project', 'Branch', 'Status', 'Created', 'Time Ago', 'User']
@@ -242,59 +776,45 @@ def main():
     with tab2:
         st.header("⏳ Pending Pipelines")
         
-        if 'all_pipelines_data' in locals():
-            pending_df = pd.DataFrame([p for p in all_pipelines_data if p['Status'] in ['pending', 'created', 'running']])
+        if 'pending_df' in st.session_state:
+            pending_df = st.session_state['pending_df']
             
             if not pending_df.empty:
-                for _, pipeline in pending_df.iterrows():
-                    with st.expander(f"{get_status_color(pipeline['Status'])} {pipeline['Project']} - {pipeline['Branch']}"):
-                        col1, col2 = st.columns(2)
-                        
-                        with col1:
-                            st.write(f"**Status:** {pipeline['Status']}")
-                            st.write(f"**Branch:** {pipeline['Branch']}")
-                            st.write(f"**Created:** {dashboard.format_datetime(pipeline['Created'])}")
-                            st.write(f"**User:** {pipeline['User']}")
-                        
-                        with col2:
-                            if pipeline['Web URL']:
-                                st.markdown(f"[View Pipeline]({pipeline['Web URL']})")
-                            
-                            # Get pipeline jobs for more details
-                            jobs = dashboard.get_pipeline_jobs(pipeline['Project ID'], pipeline['Pipeline ID'])
-                            if jobs:
-                                st.write("**Jobs:**")
-                                for job in jobs:
-                                    job_status = get_status_color(job['status'])
-                                    st.write(f"{job_status} {job['name']} - {job['status']}")
+                pending_view = pd.DataFrame({
+                    'Status Icon': get_status_colors(pending_df['Status']),
+                    'Project': pending_df['Project'],
+                    'Branch': pending_df['Branch'],
+                    'Status': pending_df['Status'],
+                    'Created': format_datetimes(pending_df['Created']),
+                    'User': pending_df['User'],
+                    'Web URL': pending_df['Web URL']
+                })
+                
+                pipeline_ids = tuple(pending_df['Pipeline ID'].tolist())
+                selected = select_pipelines(pending_view, pipeline_ids, 'pending_pipelines')
+                show_selected_jobs(dashboard, pending_df, pending_df['Pipeline ID'].isin(selected))
             else:
                 st.info("No pending pipelines found!")
     
     with tab3:
         st.header("✅ Recent Successful Pipelines")
         
-        if 'all_pipelines_data' in locals():
-            success_df = pd.DataFrame([p for p in all_pipelines_data if p['Status'] == 'success'])
+        if 'success_df' in st.session_state:
+            # Most recent 10 successes, already sorted
+            success_df = st.session_state['success_df']
             
             if not success_df.empty:
-                # Sort by most recent
-                success_df = success_df.sort_values('Updated', ascending=False)
+                recent_view = pd.DataFrame({
+                    'Project': success_df['Project'],
+                    'Branch': success_df['Branch'],
+                    'Completed': get_times_ago(success_df['Updated']),
+                    'Web URL': success_df['Web URL']
+                })
                 
-                for _, pipeline in success_df.head(10).iterrows():  # Show last 10 successes
-                    with st.container():
-                        col1, col2, col3 = st.columns([3, 2, 1])
-                        
-                        with col1:
-                            st.write(f"✅ **{pipeline['Project']}** - {pipeline['Branch']}")
-                        
-                        with col2:
-                            st.write(f"Completed: {dashboard.get_time_ago(pipeline['Updated'])}")
-                        
-                        with col3:
-                            if pipeline['Web URL']:
-                                st.markdown(f"[View]({pipeline['Web URL']})")
-                        
-                        st.divider()
+                pipeline_ids = tuple(success_df['Pipeline ID'].tolist())
+                selected = select_pipelines(recent_view, pipeline_ids, 'recent_successes')
+                # Jobs of finished pipelines are kept on disk after the first load
+                show_selected_jobs(dashboard, success_df, success_df['Pipeline ID'].isin(selected))
             else:
                 st.info("No successful pipelines found!")
     